@@ -1,40 +1,25 @@
 """
-langchain_orchestrator.py (robust imports)
+langchain_orchestrator.py
 
-This version uses defensive imports so it works across LangChain releases.
-It uses ChatOpenAI from langchain_openai and LangChain chains (LLMChain + PromptTemplate)
-with multiple import fallbacks.
+Uses ChatOpenAI from langchain_openai. Prompts are plain format strings
+(see agents.langchain_tools.PromptChain) sent straight to the chat model,
+so no LLMChain / PromptTemplate import fallbacks are needed.
 
 Run:
   $env:OPENAI_API_KEY="sk-..."
   python -m agents.langchain_orchestrator
+
+Responses are cached on disk under .llm_cache/ (temperature=0 calls only);
+set LLM_CACHE=0 to always hit the API. LLM_CONCURRENCY (default 8) caps the
+number of model calls in flight; run_batch() runs many products concurrently.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 from pathlib import Path
-
-# Defensive imports for LLMChain and PromptTemplate (different langchain versions expose them in different modules)
-try:
-    # preferred for newer versions
-    from langchain.chains import LLMChain
-except Exception:
-    try:
-        from langchain.llms import LLMChain  # older layout (unlikely)
-    except Exception:
-        # final fallback - try the direct submodule that sometimes exists
-        try:
-            from langchain.chains.llm import LLMChain
-        except Exception as e:
-            raise ImportError("Could not import LLMChain from langchain. Try upgrading/downgrading langchain package.") from e
-
-try:
-    from langchain.prompts import PromptTemplate
-except Exception:
-    try:
-        from langchain import PromptTemplate
-    except Exception as e:
-        raise ImportError("Could not import PromptTemplate from langchain. Try installing a compatible langchain version.") from e
+from typing import Any, Callable, Dict, List, Optional
 
 # ChatOpenAI client (langchain-openai package)
 try:
@@ -48,57 +33,186 @@ from agents.langchain_tools import (
     build_question_chain,
     build_blocks_chain,
     build_page_render_chain,
+    PromptChain,
 )
+from agents.page_assembly_agent import build_product_page, build_comparison_page
 from agents.utils import load_assignment_product, write_json
 
 
+# Read once at import; the process never changes its model mid-run.
+PREFERRED_MODEL = os.environ.get("PREFERRED_MODEL", "gpt-4o-mini")
+
+# Keyword ChatOpenAI takes for the model name ('model', or 'model_name' on older
+# releases). Probed on the first make_llm() call and reused afterwards.
+_model_kwarg = None
+
+
 def make_llm():
     """
     Create a deterministic chat LLM. Set env PREFERRED_MODEL to override model.
     """
-    preferred = os.environ.get("PREFERRED_MODEL", "gpt-4o-mini")
-    # ChatOpenAI signature may differ between versions; this is the common one.
-    try:
-        return ChatOpenAI(model=preferred, temperature=0.0)
-    except TypeError:
-        # older ChatOpenAI used 'model_name' parameter
-        return ChatOpenAI(model_name=preferred, temperature=0.0)
+    global _model_kwarg
+    if _model_kwarg is None:
+        try:
+            llm = ChatOpenAI(model=PREFERRED_MODEL, temperature=0.0)
+        except TypeError:
+            # older ChatOpenAI used 'model_name' parameter
+            _model_kwarg = "model_name"
+        else:
+            _model_kwarg = "model"
+            return llm
+    return ChatOpenAI(**{_model_kwarg: PREFERRED_MODEL}, temperature=0.0)
+
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / ".llm_cache"
 
 
-def run_chain(chain: LLMChain, **kwargs) -> str:
+class LLMCache:
     """
-    Safe runner for an LLMChain. Returns raw LLM string output.
+    Content-addressed on-disk cache for deterministic (temperature=0) chain calls.
+
+    Keys are SHA-256 of (model, prompt template, kwargs); each entry is stored as
+    one small JSON file so concurrent writers never touch the same file.
+    Set env LLM_CACHE=0 to disable.
     """
-    # LLMChain.run is the usual API. If unavailable, try calling chain.predict.
-    if hasattr(chain, "run"):
-        return chain.run(**kwargs)
-    elif hasattr(chain, "predict"):
-        return chain.predict(**kwargs)
-    else:
-        raise RuntimeError("LLMChain has neither run() nor predict() methods.")
 
+    def __init__(self, directory: Path = CACHE_DIR, enabled: bool = True):
+        self.directory = directory
+        self.enabled = enabled
 
-def main():
-    print("LangChain orchestrator (robust) starting...")
+    def key_for(self, chain: PromptChain, kwargs: dict):
+        """Return the cache key for this call, or None if the call is not cacheable."""
+        if not self.enabled or getattr(chain.llm, "temperature", None) != 0:
+            return None
+        payload = {
+            "model": getattr(chain.llm, "model_name", getattr(chain.llm, "model", "")),
+            "template": chain.template,
+            "kwargs": kwargs,
+        }
+        blob = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
 
-    llm = make_llm()
-    print("Using LLM:", getattr(llm, "model", getattr(llm, "model_name", "ChatOpenAI")))
+    def get(self, key):
+        """Return the cached output, or None on a miss (including unreadable or corrupt entries)."""
+        if key is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            output = json.loads(path.read_text(encoding="utf-8"))["output"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return output if isinstance(output, str) else None
+
+    def set(self, key, output: str):
+        if key is None:
+            return
+        self.directory.mkdir(exist_ok=True)
+        path = self.directory / f"{key}.json"
+        path.write_text(json.dumps({"output": output}, ensure_ascii=False), encoding="utf-8")
+
+
+LLM_CACHE = LLMCache(enabled=os.environ.get("LLM_CACHE", "1") != "0")
+
+
+def _store_if_valid(key, out: str, validate: Optional[Callable[[str], Any]]) -> None:
+    """Cache out only if validate (e.g. json.loads) accepts it, so a bad response is retried next run."""
+    if validate is not None:
+        try:
+            validate(out)
+        except Exception:
+            return
+    LLM_CACHE.set(key, out)
+
+
+def run_chain(chain: PromptChain, validate: Optional[Callable[[str], Any]] = None, **kwargs) -> str:
+    """
+    Run a PromptChain. Returns raw LLM string output (served from LLM_CACHE on hit).
+    If validate is given, the output is cached only when validate(output) does not raise.
+    """
+    key = LLM_CACHE.key_for(chain, kwargs)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    out = chain.run(**kwargs)
+    _store_if_valid(key, out, validate)
+    return out
+
+
+# Upper bound on concurrent in-flight LLM calls across all pipelines (rate-limit guard).
+LLM_CONCURRENCY = int(os.environ.get("LLM_CONCURRENCY", "8"))
+
+
+async def arun_chain(
+    chain: PromptChain,
+    limiter: asyncio.Semaphore,
+    validate: Optional[Callable[[str], Any]] = None,
+    **kwargs,
+) -> str:
+    """
+    Async counterpart of run_chain, so independent chains can be awaited concurrently.
+    limiter caps the model calls in flight; it belongs to the caller's event loop
+    (one per run_batch/main call). Cache hits skip the limit.
+    """
+    key = LLM_CACHE.key_for(chain, kwargs)
+    cached = LLM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    async with limiter:
+        out = await chain.arun(**kwargs)
+    _store_if_valid(key, out, validate)
+    return out
+
+
+def make_product_b() -> Dict[str, Any]:
+    """Fictional comparison product (same as the mock orchestrator)."""
+    return {
+        "name": "DermaRadiance Serum",
+        "concentration": "12% Vitamin C",
+        "skin_type": ["Oily"],
+        "ingredients": ["Vitamin C", "Niacinamide"],
+        "benefits": ["Brightening", "Oil balancing"],
+        "how_to_use": "Apply 2–3 drops in the morning; follow with moisturizer.",
+        "side_effects": "May cause mild tingling for sensitive skin.",
+        "price": 799,
+    }
+
+
+async def run_pipeline(raw_product: Dict[str, Any], llm=None, limiter: Optional[asyncio.Semaphore] = None) -> Dict[str, Any]:
+    """
+    Run the full pipeline for one raw product.
+    Returns {"product_page": ..., "faq_page": ..., "comparison_page": ...}.
+    Pass a shared limiter to bound model calls across several pipelines.
+    """
+    llm = llm or make_llm()
+    limiter = limiter or asyncio.Semaphore(LLM_CONCURRENCY)
 
     # 1. deterministic parse
-    raw = load_assignment_product()
-    product_model = parse_product_tool(raw)
+    product_model = parse_product_tool(raw_product)
     print("Parsed product:", product_model["name"])
+    product_json = json.dumps(product_model, ensure_ascii=False)
 
-    # 2. build chains
-    question_chain = build_question_chain(llm)
-    blocks_chain = build_blocks_chain(llm)
-    product_render_chain = build_page_render_chain(llm, "product")
-    faq_render_chain = build_page_render_chain(llm, "faq")
-    comparison_render_chain = build_page_render_chain(llm, "comparison")
+    # 2. start question + blocks chains right away (both depend only on the product model).
+    #    sleep(0) gives each task one turn to get going (cache read, limiter, request);
+    #    how far it gets before the setup below runs depends on the cache and limiter.
+    print("-> Generating questions and content blocks (LLM chains)")
+    questions_task = asyncio.create_task(arun_chain(build_question_chain(llm), limiter, json.loads, product_json=product_json, min_questions=15))
+    blocks_task = asyncio.create_task(arun_chain(build_blocks_chain(llm), limiter, json.loads, product_json=product_json))
+    try:
+        await asyncio.sleep(0)
+
+        # 3. while the two calls run: product and comparison pages are plain
+        #    reshapes of structured data, so build them deterministically (no LLM hop)
+        prod_page = build_product_page(product_model)
+        comp_page = build_comparison_page(product_model, make_product_b())
+        faq_render_chain = build_page_render_chain(llm, "faq")
 
-    # 3. run question chain
-    print("-> Generating questions (LLM chain)")
-    questions_raw = run_chain(question_chain, product_json=json.dumps(product_model, ensure_ascii=False), min_questions=15)
+        questions_raw, blocks_raw = await asyncio.gather(questions_task, blocks_task)
+    finally:
+        # on any failure above, don't leave the chain tasks running unobserved
+        for task in (questions_task, blocks_task):
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(questions_task, blocks_task, return_exceptions=True)
     try:
         questions = json.loads(questions_raw)
     except Exception:
@@ -108,9 +222,6 @@ def main():
 
     print(f"Generated {len(questions)} questions")
 
-    # 4. run blocks chain
-    print("-> Generating content blocks (LLM chain)")
-    blocks_raw = run_chain(blocks_chain, product_json=json.dumps(product_model, ensure_ascii=False))
     try:
         blocks = json.loads(blocks_raw)
     except Exception:
@@ -120,54 +231,55 @@ def main():
 
     print("Blocks keys:", list(blocks.keys()))
 
-    # 5. render product page
-    print("-> Rendering product page")
-    prod_out = run_chain(product_render_chain, product_json=json.dumps(product_model, ensure_ascii=False), blocks_json=json.dumps(blocks, ensure_ascii=False), questions_json="[]", product_b_json="{}")
-    try:
-        prod_page = json.loads(prod_out)
-    except Exception:
-        print("Product page render invalid JSON. Raw output:")
-        print(prod_out)
-        raise
-    write_json("product_page.json", prod_page)
+    # 4. render the FAQ page (answers are written by the LLM from product + blocks)
+    blocks_json = json.dumps(blocks, ensure_ascii=False)
+    questions_json = json.dumps(questions, ensure_ascii=False)
 
-    # 6. render FAQ page
     print("-> Rendering FAQ page")
-    faq_out = run_chain(faq_render_chain, product_json=json.dumps(product_model, ensure_ascii=False), blocks_json=json.dumps(blocks, ensure_ascii=False), questions_json=json.dumps(questions, ensure_ascii=False), product_b_json="{}")
+    faq_out = await arun_chain(faq_render_chain, limiter, json.loads, product_json=product_json, blocks_json=blocks_json, questions_json=questions_json, product_b_json="{}")
     try:
         faq_page = json.loads(faq_out)
     except Exception:
         print("FAQ render invalid JSON. Raw output:")
         print(faq_out)
         raise
-    write_json("faq.json", faq_page)
 
-    # 7. comparison
-    product_b = {
-        "name": "DermaRadiance Serum",
-        "concentration": "12% Vitamin C",
-        "skin_type": ["Oily"],
-        "ingredients": ["Vitamin C", "Niacinamide"],
-        "benefits": ["Brightening", "Oil balancing"],
-        "how_to_use": "Apply 2–3 drops in the morning; follow with moisturizer.",
-        "side_effects": "May cause mild tingling for sensitive skin.",
-        "price": 799,
-    }
+    return {"product_page": prod_page, "faq_page": faq_page, "comparison_page": comp_page}
+
 
-    print("-> Rendering comparison page")
-    comp_out = run_chain(comparison_render_chain, product_json=json.dumps(product_model, ensure_ascii=False), blocks_json=json.dumps(blocks, ensure_ascii=False), questions_json="[]", product_b_json=json.dumps(product_b, ensure_ascii=False))
+async def run_batch(raw_products: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run the pipeline for many products concurrently with one shared LLM client.
+    Total in-flight model calls stay bounded by LLM_CONCURRENCY.
+    """
+    llm = make_llm()
+    # created here so it belongs to this call's event loop
+    limiter = asyncio.Semaphore(LLM_CONCURRENCY)
+    tasks = [asyncio.create_task(run_pipeline(raw, llm, limiter)) for raw in raw_products]
     try:
-        comp_page = json.loads(comp_out)
-    except Exception:
-        print("Comparison render invalid JSON. Raw output:")
-        print(comp_out)
-        raise
-    write_json("comparison_page.json", comp_page)
+        return await asyncio.gather(*tasks)
+    finally:
+        # if one pipeline fails, stop its siblings instead of leaving them running
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-    print("Done — outputs in ./output/ (product_page.json, faq.json, comparison_page.json)")
 
+async def main():
+    print("LangChain orchestrator (robust) starting...")
 
-if __name__ == "__main__":
-    main()
+    llm = make_llm()
+    print("Using LLM:", getattr(llm, "model", getattr(llm, "model_name", "ChatOpenAI")))
 
+    pages = await run_pipeline(load_assignment_product(), llm)
 
+    write_json("product_page.json", pages["product_page"])
+    write_json("faq.json", pages["faq_page"])
+    write_json("comparison_page.json", pages["comparison_page"])
+
+    print("Done — outputs in ./output/ (product_page.json, faq.json, comparison_page.json)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -2,11 +2,10 @@
 LangChain Tools definitions.
 
 Each tool is single-responsibility and either deterministic (pure python) or
-model-backed (LangChain LLMChain). Tools are wired into an AgentExecutor in orchestrator.
+model-backed (a PromptChain calling ChatOpenAI). Tools are wired into an AgentExecutor in orchestrator.
 """
 
-from typing import Dict, Any, List
-from langchain import LLMChain, PromptTemplate
+from typing import Dict, Any, List, AsyncIterator
 from langchain_openai import ChatOpenAI
 from langchain.tools import Tool
 from langchain.agents import AgentExecutor  # used in orchestrator
@@ -35,23 +34,54 @@ def parse_product_tool(raw_product: Dict[str, Any]) -> Dict[str, Any]:
     return model
 
 
+# -------------------------
+# Prompt runner
+# -------------------------
+class PromptChain:
+    """
+    Minimal stand-in for LLMChain: formats a fixed template with str.format and
+    calls the chat model directly, skipping LLMChain's callback and validation layers.
+    """
+
+    def __init__(self, llm: ChatOpenAI, template: str):
+        self.llm = llm
+        self.template = template
+
+    def run(self, **kwargs) -> str:
+        return self.llm.invoke(self.template.format(**kwargs)).content
+
+    async def arun(self, **kwargs) -> str:
+        return (await self.llm.ainvoke(self.template.format(**kwargs))).content
+
+    async def astream(self, **kwargs) -> AsyncIterator[str]:
+        """Yield the response text incrementally as the model streams it."""
+        async for chunk in self.llm.astream(self.template.format(**kwargs)):
+            yield chunk.content
+
+
+# Prompt layout: every template puts its static instructions first and the per-call
+# data (after "---USER DATA BELOW---") last, so provider-side prompt-prefix caching
+# can reuse the instruction tokens across calls.
+
+
 # -------------------------
 # LLM-based question generator
 # -------------------------
-def build_question_chain(llm: ChatOpenAI) -> LLMChain:
-    prompt = PromptTemplate(
-        input_variables=["product_json", "min_questions"],
-        template=(
-            "You are a structured question generator. Given the product JSON below, "
-            "produce EXACTLY {min_questions} user-facing Q&A questions (questions only, NO answers) "
-            "as a JSON array of objects with fields: question, category. Categories should be"
-            " one of: Informational, Usage, Safety, Purchase, Comparison, Ingredients. "
-            "Be concise. Use only facts from the product JSON—do not invent new facts.\n\n"
-            "PRODUCT_JSON:\n{product_json}\n\n"
-            "Output only valid JSON."
-        ),
-    )
-    return LLMChain(llm=llm, prompt=prompt)
+_QUESTION_TMPL = (
+    "You are a structured question generator. Given the product JSON below, "
+    "produce EXACTLY MIN_QUESTIONS user-facing Q&A questions (questions only, NO answers) "
+    "as a JSON array of objects with fields: question, category. Categories should be"
+    " one of: Informational, Usage, Safety, Purchase, Comparison, Ingredients. "
+    "Be concise. Use only facts from the product JSON—do not invent new facts.\n"
+    "Output only valid JSON.\n\n"
+    "---USER DATA BELOW---\n"
+    "MIN_QUESTIONS: {min_questions}\n\n"
+    "PRODUCT_JSON:\n{product_json}\n"
+)
+
+
+def build_question_chain(llm: ChatOpenAI) -> PromptChain:
+    return PromptChain(llm, _QUESTION_TMPL)
 
 
 def question_tool_factory(llm: ChatOpenAI, min_questions: int = 15) -> Tool:
@@ -69,23 +99,23 @@ def question_tool_factory(llm: ChatOpenAI, min_questions: int = 15) -> Tool:
 # -------------------------
 # LLM-based content block generator
 # -------------------------
-def build_blocks_chain(llm: ChatOpenAI) -> LLMChain:
-    prompt = PromptTemplate(
-        input_variables=["product_json"],
-        template=(
-            "You are a content-block generator. Given PRODUCT_JSON produce a JSON object with fields:\n"
-            "- summary: a 1-2 sentence product summary (use product fields only)\n"
-            "- benefits: array of benefit short bullets\n"
-            "- usage: a short usage instruction (one line)\n"
-            "- safety: a short safety note (one line)\n\n"
-            "PRODUCT_JSON:\n{product_json}\n\n"
-            "Rules:\n"
-            "1) Use only the facts in PRODUCT_JSON.\n"
-            "2) Output ONLY valid JSON (no surrounding commentary).\n"
-            "3) Keep each field concise.\n"
-        )
-    )
-    return LLMChain(llm=llm, prompt=prompt)
+_BLOCKS_TMPL = (
+    "You are a content-block generator. Given PRODUCT_JSON produce a JSON object with fields:\n"
+    "- summary: a 1-2 sentence product summary (use product fields only)\n"
+    "- benefits: array of benefit short bullets\n"
+    "- usage: a short usage instruction (one line)\n"
+    "- safety: a short safety note (one line)\n\n"
+    "Rules:\n"
+    "1) Use only the facts in PRODUCT_JSON.\n"
+    "2) Output ONLY valid JSON (no surrounding commentary).\n"
+    "3) Keep each field concise.\n\n"
+    "---USER DATA BELOW---\n"
+    "PRODUCT_JSON:\n{product_json}\n"
+)
+
+
+def build_blocks_chain(llm: ChatOpenAI) -> PromptChain:
+    return PromptChain(llm, _BLOCKS_TMPL)
 
 
 def blocks_tool_factory(llm: ChatOpenAI) -> Tool:
@@ -100,45 +130,49 @@ def blocks_tool_factory(llm: ChatOpenAI) -> Tool:
 # -------------------------
 # LLM-based template renderer -> produces full page JSON
 # -------------------------
-def build_page_render_chain(llm: ChatOpenAI, template_name: str) -> LLMChain:
+# Schema instructions per page. Literal braces are doubled because the text is
+# embedded in a template that goes through str.format.
+_PAGE_INSTRUCTIONS = {
+    "faq": (
+        "Produce a JSON object: {{\"product\": <name>, \"faqs\": [ {{\"question\":..., \"answer\":..., \"category\":...}}, ... ] }}.\n"
+        "Use the provided questions array and product/blocks to produce at least 5 Q&As. "
+        "Answer content must be derived only from product/blocks. Output only JSON."
+    ),
+    "product": (
+        "Produce a JSON object with fields: product_name, concentration, summary, key_ingredients (array), "
+        "benefits (array), how_to_use, safety_info, price, skin_type (array). "
+        "Use the provided product and blocks. Output only valid JSON."
+    ),
+    "comparison": (
+        "Produce a JSON object comparing productA and productB. Include product_a, product_b and comparison object "
+        "with price_diff string, ingredient_comparison (object with common, a_only, b_only arrays), "
+        "and benefit_comparison (object with common, a_only, b_only arrays). Use only provided product data. Output only JSON."
+    ),
+}
+
+
+_PAGE_TMPL = (
+    "You are a structured template renderer. {instr}\n\n"
+    "IMPORTANT: Output only valid JSON and adhere to the schema described.\n\n"
+    "---USER DATA BELOW---\n"
+    "PRODUCT_JSON:\n{product_json}\n\n"
+    "BLOCKS_JSON:\n{blocks_json}\n\n"
+    "QUESTIONS_JSON (may be empty for product/comparison templates):\n{questions_json}\n\n"
+    "PRODUCT_B_JSON (for comparison template):\n{product_b_json}\n"
+)
+
+# Fully specialized page prompts, built once at import.
+_PAGE_TEMPLATES = {name: _PAGE_TMPL.replace("{instr}", instr) for name, instr in _PAGE_INSTRUCTIONS.items()}
+
+
+def build_page_render_chain(llm: ChatOpenAI, template_name: str) -> PromptChain:
     """
     template_name: one of 'faq', 'product', 'comparison'
     The prompt instructs the LLM to produce fully structured JSON for the given template.
     """
-    if template_name == "faq":
-        instr = (
-            "Produce a JSON object: {\"product\": <name>, \"faqs\": [ {\"question\":..., \"answer\":..., \"category\":...}, ... ] }.\n"
-            "Use the provided questions array and product/blocks to produce at least 5 Q&As. "
-            "Answer content must be derived only from product/blocks. Output only JSON."
-        )
-    elif template_name == "product":
-        instr = (
-            "Produce a JSON object with fields: product_name, concentration, summary, key_ingredients (array), "
-            "benefits (array), how_to_use, safety_info, price, skin_type (array). "
-            "Use the provided product and blocks. Output only valid JSON."
-        )
-    elif template_name == "comparison":
-        instr = (
-            "Produce a JSON object comparing productA and productB. Include product_a, product_b and comparison object "
-            "with price_diff string, ingredient_comparison (object with common, a_only, b_only arrays), "
-            "and benefit_comparison (object with common, a_only, b_only arrays). Use only provided product data. Output only JSON."
-        )
-    else:
+    if template_name not in _PAGE_TEMPLATES:
         raise ValueError("Unknown template")
-
-    prompt = PromptTemplate(
-        input_variables=["product_json", "blocks_json", "questions_json", "product_b_json"],
-        template=(
-            "You are a structured template renderer. {instr}\n\n"
-            "PRODUCT_JSON:\n{product_json}\n\n"
-            "BLOCKS_JSON:\n{blocks_json}\n\n"
-            "QUESTIONS_JSON (may be empty for product/comparison templates):\n{questions_json}\n\n"
-            "PRODUCT_B_JSON (for comparison template):\n{product_b_json}\n\n"
-            "IMPORTANT: Output only valid JSON and adhere to the schema described.\n"
-        ).replace("{instr}", instr)
-    )
-
-    return LLMChain(llm=llm, prompt=prompt)
+    return PromptChain(llm, _PAGE_TEMPLATES[template_name])
 
 
 def page_tool_factory(llm: ChatOpenAI, template_name: str) -> Tool:
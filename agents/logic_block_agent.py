@@ -5,14 +5,23 @@ Responsibility:
 - Each function uses only the internal product model
 """
 
+import functools
+import re
 from typing import Dict, List, Any
 
 
 def summary_block(product: Dict[str, Any], max_sentences: int = 2) -> str:
-    name = product["name"]
-    conc = product.get("concentration", "")
-    benefits = product.get("benefits", [])
-    skin_types = product.get("skin_type", [])
+    return _summary(
+        product["name"],
+        product.get("concentration", ""),
+        tuple(product.get("benefits", [])),
+        tuple(product.get("skin_type", [])),
+        max_sentences,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _summary(name: str, conc: str, benefits: tuple, skin_types: tuple, max_sentences: int) -> str:
     s1 = f"{name} is a serum containing {conc}."
     s2 = f"It is formulated for {', '.join(skin_types)} skin and aims to {', '.join(benefits)}."
     return " ".join([s1, s2]) if max_sentences >= 2 else s1
@@ -27,28 +36,32 @@ def usage_block(product: Dict[str, Any]) -> str:
 
 
 def safety_block(product: Dict[str, Any]) -> str:
-    se = product.get("side_effects", "")
+    return _safety(product.get("side_effects", ""))
+
+
+@functools.lru_cache(maxsize=128)
+def _safety(se: str) -> str:
     if not se:
         return "No side effects recorded."
     return f"{se} If irritation occurs, discontinue use and consult a dermatologist."
 
 
 def compare_ingredients_block(prod_a: Dict[str, Any], prod_b: Dict[str, Any]) -> Dict[str, List[str]]:
-    a_ing = set([i.lower() for i in prod_a.get("ingredients", [])])
-    b_ing = set([i.lower() for i in prod_b.get("ingredients", [])])
-    common = sorted([i.title() for i in (a_ing & b_ing)])
-    only_a = sorted([i.title() for i in (a_ing - b_ing)])
-    only_b = sorted([i.title() for i in (b_ing - a_ing)])
+    a_ing = {i.lower() for i in prod_a.get("ingredients", [])}
+    b_ing = {i.lower() for i in prod_b.get("ingredients", [])}
+    common = sorted(i.title() for i in a_ing & b_ing)
+    only_a = sorted(i.title() for i in a_ing - b_ing)
+    only_b = sorted(i.title() for i in b_ing - a_ing)
     return {"common": common, "a_only": only_a, "b_only": only_b}
 
 
 def compare_benefits_block(prod_a: Dict[str, Any], prod_b: Dict[str, Any]) -> Dict[str, List[str]]:
-    a_ben = set([b.lower() for b in prod_a.get("benefits", [])])
-    b_ben = set([b.lower() for b in prod_b.get("benefits", [])])
+    a_ben = {b.lower() for b in prod_a.get("benefits", [])}
+    b_ben = {b.lower() for b in prod_b.get("benefits", [])}
     return {
-        "a_only": sorted([b.title() for b in (a_ben - b_ben)]),
-        "b_only": sorted([b.title() for b in (b_ben - a_ben)]),
-        "common": sorted([b.title() for b in (a_ben & b_ben)]),
+        "a_only": sorted(b.title() for b in a_ben - b_ben),
+        "b_only": sorted(b.title() for b in b_ben - a_ben),
+        "common": sorted(b.title() for b in a_ben & b_ben),
     }
 
 
@@ -63,21 +76,61 @@ def price_diff_block(prod_a: Dict[str, Any], prod_b: Dict[str, Any]) -> str:
         return f"{prod_a['name']} is ₹{pa - pb} more expensive than {prod_b['name']}."
 
 
+# FAQ intents in priority order: a question that mentions several intents is answered
+# by the first one listed. All keywords are matched in a single regex scan.
+_FAQ_INTENTS = (
+    ("overview", ("what does", "what is")),
+    ("suitability", ("suitable", "who is")),
+    ("usage", ("how should i use", "how many", "when is the best time")),
+    ("safety", ("side effect", "irritation")),
+    ("price", ("price", "cost")),
+    ("ingredients", ("ingredients",)),
+)
+_FAQ_PATTERN = re.compile(
+    "|".join(f"(?P<{intent}>{'|'.join(map(re.escape, keywords))})" for intent, keywords in _FAQ_INTENTS),
+    re.IGNORECASE,
+)
+
+
+def _answer_overview(product: Dict[str, Any]) -> str:
+    benefits = product.get("benefits", [])
+    conc = product.get("concentration", "")
+    return f"{product['name']} provides {', '.join(benefits)} and contains {conc}."
+
+
+def _answer_suitability(product: Dict[str, Any]) -> str:
+    return f"It is suitable for {', '.join(product.get('skin_type', []))} skin types."
+
+
+def _answer_usage(product: Dict[str, Any]) -> str:
+    return product.get("how_to_use", "")
+
+
+def _answer_safety(product: Dict[str, Any]) -> str:
+    return product.get("side_effects", "")
+
+
+def _answer_price(product: Dict[str, Any]) -> str:
+    return f"₹{product.get('price')}"
+
+
+def _answer_ingredients(product: Dict[str, Any]) -> str:
+    return ", ".join(product.get("ingredients", []))
+
+
+_FAQ_HANDLERS = {
+    "overview": _answer_overview,
+    "suitability": _answer_suitability,
+    "usage": _answer_usage,
+    "safety": _answer_safety,
+    "price": _answer_price,
+    "ingredients": _answer_ingredients,
+}
+
+
 def faq_answer_block(question: str, product: Dict[str, Any]) -> str:
-    q = question.lower()
-    name = product["name"]
-    if "what does" in q or "what is" in q:
-        benefits = product.get("benefits", [])
-        conc = product.get("concentration", "")
-        return f"{name} provides {', '.join(benefits)} and contains {conc}."
-    if "suitable" in q or "who is" in q:
-        return f"It is suitable for {', '.join(product.get('skin_type', []))} skin types."
-    if "how should i use" in q or "how many" in q or "when is the best time" in q:
-        return product.get("how_to_use", "")
-    if "side effect" in q or "irritation" in q:
-        return product.get("side_effects", "")
-    if "price" in q or "cost" in q:
-        return f"₹{product.get('price')}"
-    if "ingredients" in q:
-        return ", ".join(product.get("ingredients", []))
+    matched = {m.lastgroup for m in _FAQ_PATTERN.finditer(question)}
+    for intent, _ in _FAQ_INTENTS:
+        if intent in matched:
+            return _FAQ_HANDLERS[intent](product)
     return f"For {question}, refer to the product information provided: {product.get('name')}."
@@ -3,11 +3,9 @@ page_assembly_agent.py
 Assembles pages using templates and logic blocks; writes JSON outputs.
 """
 
-import json
-from pathlib import Path
 from typing import Dict, Any, List
 
-from agents.template_engine_agent import load_template, render_template
+from agents.template_engine_agent import load_compiled_template
 from agents.logic_block_agent import (
     summary_block,
     benefit_block,
@@ -18,24 +16,22 @@ from agents.logic_block_agent import (
     price_diff_block,
     faq_answer_block,
 )
-
-OUTPUT_DIR = Path(__file__).resolve().parents[1] / "output"
-OUTPUT_DIR.mkdir(exist_ok=True)
+from agents.utils import write_json  # re-exported: both orchestrators share one writer
 
 
 def build_faq_page(product: Dict[str, Any], questions: List[Dict[str, str]]) -> Dict[str, Any]:
-    template_text = load_template("faq_template.json")
+    template = load_compiled_template("faq_template.json")
     selected = questions[: max(5, len(questions))]
     faqs = []
     for q in selected:
         ans = faq_answer_block(q["question"], product)
         faqs.append({"question": q["question"], "answer": ans, "category": q.get("category")})
-    page_json = render_template(template_text, {"product": product, "faqs": faqs})
+    page_json = template.render({"product": product, "faqs": faqs})
     return page_json
 
 
 def build_product_page(product: Dict[str, Any]) -> Dict[str, Any]:
-    template_text = load_template("product_template.json")
+    template = load_compiled_template("product_template.json")
     context = {
         "product": {
             "name": product["name"],
@@ -49,12 +45,12 @@ def build_product_page(product: Dict[str, Any]) -> Dict[str, Any]:
             "skin_type": product.get("skin_type"),
         }
     }
-    page_json = render_template(template_text, context)
+    page_json = template.render(context)
     return page_json
 
 
 def build_comparison_page(prod_a: Dict[str, Any], prod_b: Dict[str, Any]) -> Dict[str, Any]:
-    template_text = load_template("comparison_template.json")
+    template = load_compiled_template("comparison_template.json")
     context = {
         "productA": {"name": prod_a["name"], "price": prod_a["price"], "ingredients": prod_a["ingredients"], "benefits": prod_a["benefits"]},
         "productB": {"name": prod_b["name"], "price": prod_b["price"], "ingredients": prod_b["ingredients"], "benefits": prod_b["benefits"]},
@@ -64,11 +60,5 @@ def build_comparison_page(prod_a: Dict[str, Any], prod_b: Dict[str, Any]) -> Dic
             "benefit_comparison": compare_benefits_block(prod_a, prod_b),
         },
     }
-    page_json = render_template(template_text, context)
+    page_json = template.render(context)
     return page_json
-
-
-def write_json(filename: str, data: Dict[str, Any]):
-    path = OUTPUT_DIR / filename
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Wrote: {path}")
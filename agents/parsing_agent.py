@@ -6,6 +6,8 @@ Responsibility:
 
 from typing import Dict, Any, List
 
+from agents.utils import strip_price_noise
+
 
 REQUIRED_FIELDS = [
     "Product Name",
@@ -65,7 +67,7 @@ def _parse_price(value) -> int:
     if isinstance(value, (int, float)):
         return int(value)
     if isinstance(value, str):
-        v = value.strip().replace("₹", "").replace("INR", "").replace(",", "").strip()
+        v = strip_price_noise(value).strip()
         try:
             return int(float(v))
         except Exception:
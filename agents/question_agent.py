@@ -17,67 +17,54 @@ DEFAULT_CATEGORIES = [
     "Ingredients",
 ]
 
-
-def generate_questions(product: Dict[str, any], min_questions: int = 15) -> List[Dict[str, str]]:
-    name = product["name"]
-    concentration = product.get("concentration", "")
-    skin_types = product.get("skin_type", [])
-    ingredients = product.get("ingredients", [])
-    benefits = product.get("benefits", [])
-    price = product.get("price")
-
-    questions = []
-
+# (template, category) pairs for the base question set, grouped by category.
+_Q_TEMPLATES = (
     # Informational (4)
-    questions += [
-        {"question": f"What does {name} do?", "category": "Informational"},
-        {"question": f"What is the active concentration in {name}?", "category": "Informational"},
-        {"question": f"Who is {name} suitable for?", "category": "Informational"},
-        {"question": f"What are the key ingredients in {name}?", "category": "Ingredients"},
-    ]
-
+    ("What does {name} do?", "Informational"),
+    ("What is the active concentration in {name}?", "Informational"),
+    ("Who is {name} suitable for?", "Informational"),
+    ("What are the key ingredients in {name}?", "Ingredients"),
     # Usage (3)
-    questions += [
-        {"question": f"How should I use {name}?", "category": "Usage"},
-        {"question": f"How many drops of {name} should I apply?", "category": "Usage"},
-        {"question": f"When is the best time to apply {name}?", "category": "Usage"},
-    ]
-
+    ("How should I use {name}?", "Usage"),
+    ("How many drops of {name} should I apply?", "Usage"),
+    ("When is the best time to apply {name}?", "Usage"),
     # Safety (3)
-    questions += [
-        {"question": f"Are there any side effects of {name}?", "category": "Safety"},
-        {"question": f"Can sensitive skin use {name}?", "category": "Safety"},
-        {"question": f"What should I do if I experience irritation from {name}?", "category": "Safety"},
-    ]
-
+    ("Are there any side effects of {name}?", "Safety"),
+    ("Can sensitive skin use {name}?", "Safety"),
+    ("What should I do if I experience irritation from {name}?", "Safety"),
     # Purchase (2)
-    questions += [
-        {"question": f"How much does {name} cost?", "category": "Purchase"},
-        {"question": f"Where can I buy {name}?", "category": "Purchase"},
-    ]
-
+    ("How much does {name} cost?", "Purchase"),
+    ("Where can I buy {name}?", "Purchase"),
     # Comparison (3)
-    questions += [
-        {"question": f"How does {name} compare to Product B for brightening?", "category": "Comparison"},
-        {"question": f"Is {name} better than Product B for oily skin?", "category": "Comparison"},
-        {"question": f"What ingredients does {name} share with Product B?", "category": "Comparison"},
-    ]
+    ("How does {name} compare to Product B for brightening?", "Comparison"),
+    ("Is {name} better than Product B for oily skin?", "Comparison"),
+    ("What ingredients does {name} share with Product B?", "Comparison"),
+)
+if len({t for t, _ in _Q_TEMPLATES}) != len(_Q_TEMPLATES):
+    raise ValueError("duplicate question templates")
+
+
+def generate_questions(product: Dict[str, any], min_questions: int = 15) -> List[Dict[str, str]]:
+    name = product["name"]
+    benefits = product.get("benefits", [])
+
+    questions = [{"question": tmpl.format(name=name), "category": cat} for tmpl, cat in _Q_TEMPLATES]
 
     # Add extra questions from benefits if needed
     if len(questions) < min_questions:
+        extras = []
         for b in benefits:
-            questions.append({"question": f"How does {name} help with {b.lower()}?", "category": "Informational"})
-            if len(questions) >= min_questions:
+            extras.append({"question": f"How does {name} help with {b.lower()}?", "category": "Informational"})
+            if len(questions) + len(extras) >= min_questions:
                 break
 
-    # Deduplicate
-    seen = set()
-    unique = []
-    for q in questions:
-        key = (q["question"].strip().lower(), q["category"])
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(q)
+        # Deduplicate; the base set is unique by construction, so only the extras can repeat
+        seen = {(q["question"].strip().lower(), q["category"]) for q in questions}
+        for q in extras:
+            key = (q["question"].strip().lower(), q["category"])
+            if key in seen:
+                continue
+            seen.add(key)
+            questions.append(q)
 
-    return unique[: max(min_questions, len(unique))]
+    return questions
@@ -1,77 +1,48 @@
 # agents/run_mock_orchestrator.py
 """
-Robust mock orchestrator — loads agent modules by file path and registers them
-under package-style names in sys.modules so internal 'from agents.xxx import ...'
-works. This avoids package/importpath issues.
+Robust mock orchestrator — puts the project root on sys.path and imports the
+agent modules as the 'agents' package, so internal 'from agents.xxx import ...'
+works and the standard import system reuses cached bytecode from __pycache__.
 
 Run:
     python .\agents\run_mock_orchestrator.py
 """
 
-import importlib.util
-import json
+import importlib
+import os
 import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]  # project root
-AGENTS_DIR = ROOT / "agents"
-OUTPUT_DIR = ROOT / "output"
-OUTPUT_DIR.mkdir(exist_ok=True)
-
-
-def load_and_register(name: str, path: Path, package_prefix: str = "agents"):
-    """
-    Load module from path and register in sys.modules under two keys:
-      - simple name (e.g., 'parsing_agent')
-      - package name (e.g., 'agents.parsing_agent')
-    Returns the module object.
-    """
-    if not path.exists():
-        raise FileNotFoundError(f"Module file not found: {path}")
-
-    spec = importlib.util.spec_from_file_location(name, str(path))
-    if spec is None:
-        raise ImportError(f"Cannot load spec for {name} at {path}")
-    mod = importlib.util.module_from_spec(spec)
-    loader = spec.loader
-    if loader is None:
-        raise ImportError(f"No loader for spec {spec} (module {name})")
-    # execute module
-    loader.exec_module(mod)
-
-    # register in sys.modules under both names so intra-package imports work
-    sys.modules[name] = mod
-    pkg_name = f"{package_prefix}.{name}"
-    sys.modules[pkg_name] = mod
-    return mod
-
-
-# Expected files
-expected_files = [
-    "parsing_agent.py",
-    "question_agent.py",
-    "logic_block_agent.py",
-    "template_engine_agent.py",
-    "page_assembly_agent.py",
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # project root
+AGENTS_DIR = os.path.join(ROOT, "agents")
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Expected agent modules, in dependency order
+expected_names = [
+    "parsing_agent",
+    "question_agent",
+    "logic_block_agent",
+    "template_engine_agent",
+    "page_assembly_agent",
 ]
 
-missing = [f for f in expected_files if not (AGENTS_DIR / f).exists()]
+# one directory listing instead of a stat per module
+with os.scandir(AGENTS_DIR) as entries:
+    present = {entry.name for entry in entries}
+missing = [f"{name}.py" for name in expected_names if f"{name}.py" not in present]
 if missing:
     raise FileNotFoundError(f"Missing agent files in agents/: {missing}. Please ensure these files exist.")
 
-# Load & register modules under 'agents.<module>'
-parsing_mod = load_and_register("parsing_agent", AGENTS_DIR / "parsing_agent.py")
-question_mod = load_and_register("question_agent", AGENTS_DIR / "question_agent.py")
-logic_mod = load_and_register("logic_block_agent", AGENTS_DIR / "logic_block_agent.py")
-template_mod = load_and_register("template_engine_agent", AGENTS_DIR / "template_engine_agent.py")
-page_assembly_mod = load_and_register("page_assembly_agent", AGENTS_DIR / "page_assembly_agent.py")
-
-# Now imports like "from agents.template_engine_agent import ..." will resolve.
+# Import as 'agents.<module>'; modules already imported come straight from sys.modules
+mods = {name: importlib.import_module(f"agents.{name}") for name in expected_names}
 
 # Alias functions we need
-parse_raw_dataset = parsing_mod.parse_raw_dataset
-generate_questions = question_mod.generate_questions
+parse_raw_dataset = mods["parsing_agent"].parse_raw_dataset
+generate_questions = mods["question_agent"].generate_questions
 
+page_assembly_mod = mods["page_assembly_agent"]
 build_faq_page = page_assembly_mod.build_faq_page
 build_product_page = page_assembly_mod.build_product_page
 build_comparison_page = page_assembly_mod.build_comparison_page
@@ -103,7 +74,7 @@ def make_product_b():
 
 
 def main():
-    print("Mock orchestrator (registered-loader) starting...")
+    print("Mock orchestrator (package imports) starting...")
 
     # parse
     product = parse_raw_dataset(RAW_PRODUCT)
@@ -119,10 +90,17 @@ def main():
     product_b = make_product_b()
     comparison_page = build_comparison_page(product, product_b)
 
-    # write outputs
-    write_json("faq.json", faq_page)
-    write_json("product_page.json", product_page)
-    write_json("comparison_page.json", comparison_page)
+    # write outputs; the three files are independent, so their writes overlap.
+    # Workers stay quiet and the main thread reports in a fixed order.
+    outputs = [
+        ("faq.json", faq_page),
+        ("product_page.json", product_page),
+        ("comparison_page.json", comparison_page),
+    ]
+    with ThreadPoolExecutor(max_workers=len(outputs)) as ex:
+        paths = list(ex.map(lambda item: write_json(*item, log=False), outputs))
+    for path in paths:
+        print(f"Wrote: {path}")
 
     print("Done. Files written to ./output/")
 
@@ -6,27 +6,111 @@ Robust template engine for JSON templates.
 - Detects whether the placeholder appears inside JSON string quotes and
   injects appropriately to avoid double-quoting.
 - Embeds lists/dicts as JSON literals.
+- Templates are compiled once (compile_template) into literal parts and
+  placeholder slots; render_template reuses the compiled form. Template files
+  are read once and cached with their compiled form (load_compiled_template);
+  set TEMPLATE_AUTO_RELOAD=1 to re-read them whenever their mtime changes.
+- Templates that are valid JSON once placeholders are swapped for sentinels are
+  also parsed at compile time, so rendering builds the output objects directly
+  instead of re-parsing filled text.
 """
 
+import functools
 import json
+import os
 import re
-from pathlib import Path
+import sys
 from typing import Dict, Any
 
-TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates"
-PLACEHOLDER_PATTERN = re.compile(r"\{\{\s*([a-zA-Z0-9_\.]+)\s*\}\}")
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+# Placeholder syntax: "{{", optional whitespace, a dotted key of [A-Za-z0-9_.], optional whitespace, "}}".
+_KEY_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_.")
+# JSON string escapes as json.dumps(..., ensure_ascii=False) writes them, for quoted string values.
+_JSON_ESC_TABLE = {c: f"\\u{c:04x}" for c in range(0x20)}
+_JSON_ESC_TABLE.update({ord('"'): '\\"', ord("\\"): "\\\\", ord("\n"): "\\n", ord("\r"): "\\r",
+                        ord("\t"): "\\t", ord("\b"): "\\b", ord("\f"): "\\f"})
+_NEEDS_ESCAPE_RE = re.compile(r'["\\\x00-\x1f]')
+# Sentinel string standing in for slot i while the template is parsed at compile time.
+_SENTINEL_PREFIX = "\x00tpl-slot-"
+
+
+# Templates are static at runtime, so cached files are not re-checked unless this is set.
+TEMPLATE_AUTO_RELOAD = os.environ.get("TEMPLATE_AUTO_RELOAD", "0") != "0"
+
+# name -> (st_mtime_ns, template text, compiled template or None until first requested)
+_TEMPLATE_CACHE: Dict[str, list] = {}
+
+
+def _template_entry(name: str) -> list:
+    """
+    Return the cache entry for a template file.
+
+    A cached entry is returned without touching the filesystem; with
+    TEMPLATE_AUTO_RELOAD the file is stat'ed and re-read when its mtime changes.
+    """
+    entry = _TEMPLATE_CACHE.get(name)
+    if entry is not None and not TEMPLATE_AUTO_RELOAD:
+        return entry
+    path = os.path.join(TEMPLATES_DIR, name)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template not found: {path}") from None
+    if entry is None or entry[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            entry = [mtime, f.read(), None]
+        _TEMPLATE_CACHE[name] = entry
+    return entry
 
 
 def load_template(name: str) -> str:
-    path = TEMPLATES_DIR / name
-    if not path.exists():
-        raise FileNotFoundError(f"Template not found: {path}")
-    return path.read_text(encoding="utf-8")
+    """Return a template's text, read from disk once per process (see TEMPLATE_AUTO_RELOAD)."""
+    return _template_entry(name)[1]
+
+
+def load_compiled_template(name: str) -> "CompiledTemplate":
+    """Return a template file compiled, cached alongside its text."""
+    entry = _template_entry(name)
+    if entry[2] is None:
+        entry[2] = CompiledTemplate(entry[1])
+    return entry[2]
+
+
+def _scan_placeholders(text: str):
+    """
+    Yield (start, end, key) for each placeholder, left to right.
+
+    Hand-written single pass: str.find locates each "{{" and the key is read
+    character by character, so no regex engine is involved. Text that merely
+    starts with "{{" but is not a valid placeholder is skipped one character at
+    a time, which keeps cases like "{{{x}}}" matching the inner "{{x}}".
+    """
+    n = len(text)
+    pos = text.find("{{")
+    while pos != -1:
+        i = pos + 2
+        while i < n and text[i].isspace():
+            i += 1
+        key_start = i
+        while i < n and text[i] in _KEY_CHARS:
+            i += 1
+        key_end = i
+        while i < n and text[i].isspace():
+            i += 1
+        if key_end > key_start and text.startswith("}}", i):
+            yield pos, i + 2, text[key_start:key_end]
+            pos = text.find("{{", i + 2)
+        else:
+            pos = text.find("{{", pos + 1)
 
 
 def _lookup_context(context: Dict[str, Any], key: str):
     """Lookup nested key via dot notation; return None if missing."""
-    parts = key.split(".")
+    return _lookup_path(context, key.split("."))
+
+
+def _lookup_path(context: Dict[str, Any], parts) -> Any:
+    """Lookup a pre-split dotted path; return None if missing."""
     cur = context
     for p in parts:
         if not isinstance(cur, dict):
@@ -37,72 +121,189 @@ def _lookup_context(context: Dict[str, Any], key: str):
     return cur
 
 
-def render_template(template_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Replace placeholders in template_text using context dict.
+# Per-position value formatters. Whether a placeholder sits inside quotes is fixed at
+# compile time, so each slot is bound to one of these instead of branching per render.
 
-    Behavior:
-    - If placeholder is inside quotes in the template and the replacement is a primitive string,
-      the function injects the escaped inner string content (without additional outer quotes).
-    - If placeholder is unquoted and replacement is primitive, inject JSON literal (with quotes for strings).
-    - If replacement is list/dict, inject JSON literal (templates must leave such placeholders unquoted).
-    """
+def _format_quoted(value: Any) -> str:
+    """Text for a placeholder inside quotes: the JSON string content, without outer quotes."""
+    # If value missing -> leave an empty string
+    if value is None:
+        return ""
 
-    filled_parts = []
-    last_index = 0
+    # If value is list/dict -> insert JSON literal (templates should have unquoted placeholder)
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
 
-    for match in PLACEHOLDER_PATTERN.finditer(template_text):
-        start, end = match.span()
-        key = match.group(1)
+    # Strings: most need no escaping at all, the rest go through the escape table
+    if isinstance(value, str):
+        if _NEEDS_ESCAPE_RE.search(value) is None:
+            return value
+        return value.translate(_JSON_ESC_TABLE)
 
-        # append text before match
-        filled_parts.append(template_text[last_index:start])
+    # Other primitives (int/float/bool): JSON text, outer quotes stripped if any
+    json_prim = json.dumps(value, ensure_ascii=False)
+    if len(json_prim) >= 2 and json_prim[0] == '"' and json_prim[-1] == '"':
+        return json_prim[1:-1]
+    return json_prim
 
-        # detect surrounding characters to check if placeholder is inside JSON quotes
-        before = template_text[:start]
-        after = template_text[end:]
-        char_before = before[-1] if before else ""
-        char_after = after[0] if after else ""
-        inside_quotes = (char_before == '"' and char_after == '"')
 
-        # lookup value
-        value = _lookup_context(context, key)
+def _format_literal(value: Any) -> str:
+    """Text for an unquoted placeholder: a JSON literal (strings will be quoted)."""
+    # If value missing -> insert null
+    if value is None:
+        return "null"
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _tree_quoted(value: Any) -> Any:
+    """Tree-mode value for a placeholder inside quotes: the string parsing _format_quoted's text yields."""
+    if value is None:
+        return ""
+    if type(value) is str:
+        return value
+    return json.loads('"' + _format_quoted(value) + '"')
 
-        # If value missing -> insert null (respect quotes: if inside quotes leave empty string)
-        if value is None:
-            if inside_quotes:
-                filled_parts.append("")  # keep template quotes, insert empty string
-            else:
-                filled_parts.append("null")
-            last_index = end
-            continue
 
-        # If value is list/dict -> insert JSON literal (templates should have unquoted placeholder)
-        if isinstance(value, (list, dict)):
-            filled_parts.append(json.dumps(value, ensure_ascii=False))
+def _tree_literal(value: Any) -> Any:
+    """Tree-mode value for an unquoted placeholder: a JSON round trip, skipped for plain primitives."""
+    if value is None or type(value) in (str, int, float, bool):
+        return value
+    return json.loads(json.dumps(value, ensure_ascii=False))
+
+
+class _NotCompilable(Exception):
+    """Template cannot be rendered from a pre-parsed tree; use the text path."""
+
+
+def _tree_builder(node: Any, sentinels: Dict[str, int], found: set):
+    """
+    Turn a parsed template node into a function values -> fresh output object.
+
+    Sentinel strings become slot lookups; every dict/list is rebuilt per call so
+    renders never share mutable state. Raises _NotCompilable if a sentinel shows
+    up anywhere other than as a whole string value.
+    """
+    if isinstance(node, str):
+        if _SENTINEL_PREFIX not in node:
+            return lambda values: node
+        idx = sentinels.get(node)
+        if idx is None or idx in found:
+            raise _NotCompilable(node)
+        found.add(idx)
+        return lambda values: values[idx]
+    if isinstance(node, dict):
+        if any(_SENTINEL_PREFIX in k for k in node):
+            raise _NotCompilable("placeholder in object key")
+        items = [(sys.intern(k), _tree_builder(v, sentinels, found)) for k, v in node.items()]
+        return lambda values: {k: build(values) for k, build in items}
+    if isinstance(node, list):
+        builders = [_tree_builder(v, sentinels, found) for v in node]
+        return lambda values: [build(values) for build in builders]
+    return lambda values: node
+
+
+class CompiledTemplate:
+    """
+    A template scanned once into literal text and placeholder slots.
+
+    parts[i] is the literal text preceding slot i (parts has one extra trailing entry);
+    slots[i] is (parent index, leaf key, inside_quotes). Dotted keys are split at
+    compile time and their parent paths de-duplicated into `parents`, so sibling keys
+    such as product.name / product.price walk the shared prefix once per render.
+    slot_formatters pairs each slot with the value formatter for its position.
+
+    When the template parses as JSON with each placeholder swapped for a sentinel
+    string, `build` holds a tree builder and render() skips the text round trip;
+    otherwise build is None and render() fills parts and parses the result.
+    """
+
+    def __init__(self, template_text: str):
+        parts = []
+        slots = []
+        parents = {}
+        last_index = 0
+        for start, end, key in _scan_placeholders(template_text):
+            parts.append(template_text[last_index:start])
+            # placeholder is inside JSON quotes if the characters around it are both '"'
+            char_before = template_text[start - 1] if start > 0 else ""
+            char_after = template_text[end] if end < len(template_text) else ""
+            inside_quotes = char_before == '"' and char_after == '"'
+            # interned so per-render dict lookups hit the cached hash and identity check
+            *parent, leaf = map(sys.intern, key.split("."))
+            parent_idx = parents.setdefault(tuple(parent), len(parents))
+            slots.append((parent_idx, leaf, inside_quotes))
             last_index = end
-            continue
-
-        # For primitives (str/int/float/bool)
-        # If placeholder is inside quotes -> produce JSON string and strip outer quotes
-        if inside_quotes:
-            json_prim = json.dumps(value, ensure_ascii=False)
-            # If json_prim is a quoted string, strip the outer quotes to avoid double quotes
-            if isinstance(json_prim, str) and len(json_prim) >= 2 and json_prim[0] == '"' and json_prim[-1] == '"':
-                inner = json_prim[1:-1]
-            else:
-                inner = json_prim
-            filled_parts.append(inner)
+        parts.append(template_text[last_index:])
+        self.parts = parts
+        self.slots = slots
+        self.parents = list(parents)
+        self.build = self._compile_tree()
+        # parts interleaved with placeholder positions, copied as the output list of each text-path render
+        self.filled_skeleton = [None] * (2 * len(slots) + 1)
+        self.filled_skeleton[0::2] = parts
+        # (parent index, leaf key, formatter) per slot, specialized for the render path in use
+        if self.build is not None:
+            self.slot_formatters = [(p, leaf, _tree_quoted if q else _tree_literal) for p, leaf, q in slots]
         else:
-            # not inside quotes -> inject JSON literal (strings will be quoted)
-            filled_parts.append(json.dumps(value, ensure_ascii=False))
+            self.slot_formatters = [(p, leaf, _format_quoted if q else _format_literal) for p, leaf, q in slots]
+
+    def _compile_tree(self):
+        sentinel_parts = [self.parts[0]]
+        sentinels = {}
+        for i, ((_, _, inside_quotes), literal) in enumerate(zip(self.slots, self.parts[1:])):
+            sentinel = f"{_SENTINEL_PREFIX}{i}\x00"
+            sentinels[sentinel] = i
+            escaped = json.dumps(sentinel)
+            sentinel_parts.append(escaped[1:-1] if inside_quotes else escaped)
+            sentinel_parts.append(literal)
+        try:
+            tree = json.loads("".join(sentinel_parts))
+            found = set()
+            build = _tree_builder(tree, sentinels, found)
+        except (ValueError, _NotCompilable):
+            return None
+        if len(found) != len(self.slots):
+            return None
+        return build
+
+    def render(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.slots and self.build is not None:
+            # static template: skip context lookups and just rebuild the pre-parsed JSON
+            return self.build(())
+        # resolve each distinct parent path once; () resolves to the context itself
+        resolved = [_lookup_path(context, path) for path in self.parents]
+        if self.build is not None:
+            values = []
+            for parent_idx, leaf, fmt in self.slot_formatters:
+                obj = resolved[parent_idx]
+                values.append(fmt(obj.get(leaf) if isinstance(obj, dict) else None))
+            return self.build(values)
+
+        # literals already sit at the even indices; only the slot positions are written
+        filled_parts = self.filled_skeleton.copy()
+        for out_idx, (parent_idx, leaf, fmt) in zip(range(1, len(filled_parts), 2), self.slot_formatters):
+            obj = resolved[parent_idx]
+            filled_parts[out_idx] = fmt(obj.get(leaf) if isinstance(obj, dict) else None)
+        filled = "".join(filled_parts)
 
-        last_index = end
+        # parse into JSON and return; stdlib json keeps big ints exact and accepts NaN/Infinity
+        return json.loads(filled)
 
-    # append remainder
-    filled_parts.append(template_text[last_index:])
-    filled = "".join(filled_parts)
 
-    # parse into JSON and return
-    return json.loads(filled)
+@functools.lru_cache(maxsize=32)
+def compile_template(template_text: str) -> CompiledTemplate:
+    """Compile template text once; repeated renders of the same text reuse the result."""
+    return CompiledTemplate(template_text)
 
+
+def render_template(template_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace placeholders in template_text using context dict.
+
+    Behavior:
+    - If placeholder is inside quotes in the template and the replacement is a primitive string,
+      the function injects the escaped inner string content (without additional outer quotes).
+    - If placeholder is unquoted and replacement is primitive, inject JSON literal (with quotes for strings).
+    - If replacement is list/dict, inject JSON literal (templates must leave such placeholders unquoted).
+    """
+    return compile_template(template_text).render(context)
@@ -1,25 +1,36 @@
 # test_langchain_install.py
 import sys
-print("Python:", sys.version)
-try:
-    # Try a few import paths we used in the code
-    print("Importing ChatOpenAI ...", end=" ")
-    from langchain_openai import ChatOpenAI
-    print("OK")
-except Exception as e:
-    print("FAILED:", type(e).__name__, e)
 
-try:
-    print("Importing LLMChain / PromptTemplate ...", end=" ")
-    # try common import locations
+
+def _check_chatopenai():
+    try:
+        # Try a few import paths we used in the code
+        print("Importing ChatOpenAI ...", end=" ")
+        from langchain_openai import ChatOpenAI
+        print("OK")
+    except Exception as e:
+        print("FAILED:", type(e).__name__, e)
+
+
+def _check_chains():
     try:
-        from langchain.chains import LLMChain
-    except Exception:
+        print("Importing LLMChain / PromptTemplate ...", end=" ")
+        # try common import locations
         try:
-            from langchain.chains.llm import LLMChain
+            from langchain.chains import LLMChain
         except Exception:
-            from langchain.llms import LLMChain  # fallback
-    from langchain.prompts import PromptTemplate
-    print("OK")
-except Exception as e:
-    print("FAILED:", type(e).__name__, e)
+            try:
+                from langchain.chains.llm import LLMChain
+            except Exception:
+                from langchain.llms import LLMChain  # fallback
+        from langchain.prompts import PromptTemplate
+        print("OK")
+    except Exception as e:
+        print("FAILED:", type(e).__name__, e)
+
+
+# Imports happen only when run as a script, so test discovery can import this file cheaply.
+if __name__ == "__main__":
+    print("Python:", sys.version)
+    _check_chatopenai()
+    _check_chains()
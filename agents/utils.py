@@ -3,18 +3,64 @@ Utility helpers.
 """
 
 import json
-from pathlib import Path
+import os
+import tempfile
 from typing import Dict, Any
 
+try:
+    import orjson  # optional C-accelerated serializer
+except ImportError:
+    orjson = None
 
-OUTPUT_DIR = Path(__file__).resolve().parents[1] / "output"
-OUTPUT_DIR.mkdir(exist_ok=True)
 
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "output")
+# created on the first write_json call rather than at import
+_output_dir_ready = False
 
-def write_json(filename: str, data: Dict[str, Any]):
-    path = OUTPUT_DIR / filename
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-    print(f"Wrote: {path}")
+
+# configured once instead of per call
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _json_dumps(data: Any) -> bytes:
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+if orjson is not None:
+    def _dumps(data: Any) -> bytes:
+        # Same bytes as _json_dumps for strings, ints, bools, None and plain floats, but not
+        # for every value: orjson writes exponents as 1e16 / 1e-7 (json: 1e+16 / 1e-07)
+        # and NaN/Infinity as null (json: NaN / Infinity). Values orjson rejects, such as
+        # ints wider than 64 bits, are written by json instead.
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(data)
+else:
+    _dumps = _json_dumps
+
+
+def write_json(filename: str, data: Dict[str, Any], log: bool = True) -> str:
+    global _output_dir_ready
+    if not _output_dir_ready:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        _output_dir_ready = True
+    path = os.path.join(OUTPUT_DIR, filename)
+    data_bytes = _dumps(data)
+    # write to a uniquely named sibling temp file and rename it over the target, so readers
+    # never see a partial file and concurrent writers of the same name don't share a temp file
+    f = tempfile.NamedTemporaryFile(dir=os.path.dirname(path), prefix=f".{filename}.", suffix=".tmp", delete=False)
+    try:
+        with f:
+            f.write(data_bytes)
+        os.chmod(f.name, 0o644)  # NamedTemporaryFile creates 0600; keep normal output permissions
+        os.replace(f.name, path)
+    except BaseException:
+        os.unlink(f.name)
+        raise
+    if log:
+        print(f"Wrote: {path}")
+    return path
 
 
 def load_assignment_product() -> Dict[str, Any]:
@@ -34,7 +80,15 @@ def load_assignment_product() -> Dict[str, Any]:
     }
 
 
+# Characters dropped from price strings in one str.translate pass.
+_PRICE_STRIP = str.maketrans("", "", "₹,")
+
+
+def strip_price_noise(text: str) -> str:
+    """Remove currency markers (₹, INR) and thousands separators from a price string."""
+    return text.translate(_PRICE_STRIP).replace("INR", "")
+
+
 def safe_parse_price(price_str: str) -> int:
-    # simple sanitizer: remove currency symbol and parse int
-    v = str(price_str).strip().replace("₹", "").replace("INR", "").replace(",", "").strip()
-    return int(float(v))
+    # simple sanitizer: remove currency symbol and parse int (float() ignores surrounding whitespace)
+    return int(float(strip_price_noise(str(price_str))))
@@ -1,35 +1,48 @@
 # test_langchain_install.py
 
 import sys
-print("Python:", sys.version)
-
-print("\n--- Testing ChatOpenAI import ---")
-try:
-    from langchain_openai import ChatOpenAI
-    print("ChatOpenAI: OK")
-except Exception as e:
-    print("ChatOpenAI FAILED:", type(e).__name__, e)
-
-print("\n--- Testing LLMChain + PromptTemplate imports ---")
-try:
-    # Trying new location
-    from langchain.chains import LLMChain
-    print("LLMChain (langchain.chains): OK")
-except Exception:
+
+
+def _check_chatopenai():
+    print("\n--- Testing ChatOpenAI import ---")
+    try:
+        from langchain_openai import ChatOpenAI
+        print("ChatOpenAI: OK")
+    except Exception as e:
+        print("ChatOpenAI FAILED:", type(e).__name__, e)
+
+
+def _check_llmchain():
+    print("\n--- Testing LLMChain + PromptTemplate imports ---")
     try:
-        # Old fallback
-        from langchain.chains.llm import LLMChain
-        print("LLMChain (langchain.chains.llm): OK")
+        # Trying new location
+        from langchain.chains import LLMChain
+        print("LLMChain (langchain.chains): OK")
     except Exception:
         try:
-            # Very old fallback
-            from langchain.llms import LLMChain
-            print("LLMChain (langchain.llms): OK")
-        except Exception as e:
-            print("LLMChain FAILED:", type(e).__name__, e)
-
-try:
-    from langchain.prompts import PromptTemplate
-    print("PromptTemplate: OK")
-except Exception as e:
-    print("PromptTemplate FAILED:", type(e).__name__, e)
+            # Old fallback
+            from langchain.chains.llm import LLMChain
+            print("LLMChain (langchain.chains.llm): OK")
+        except Exception:
+            try:
+                # Very old fallback
+                from langchain.llms import LLMChain
+                print("LLMChain (langchain.llms): OK")
+            except Exception as e:
+                print("LLMChain FAILED:", type(e).__name__, e)
+
+
+def _check_prompt_template():
+    try:
+        from langchain.prompts import PromptTemplate
+        print("PromptTemplate: OK")
+    except Exception as e:
+        print("PromptTemplate FAILED:", type(e).__name__, e)
+
+
+# Imports happen only when run as a script, so test discovery can import this file cheaply.
+if __name__ == "__main__":
+    print("Python:", sys.version)
+    _check_chatopenai()
+    _check_llmchain()
+    _check_prompt_template()